@@ -33,12 +33,229 @@
 ----------------------------------------------------------------------------
 """
 
+import io
 import os
 import re
 import sys
 import json
+import mmap
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+# Directories never worth descending into (vendored deps, VCS metadata, build outputs).
+# Matched against directory entry names while walking, never against full path strings.
+EXCLUDED_DIR_NAMES = frozenset({"node_modules", ".git", "build", ".gradle"})
+# File types searched for hardcoded secrets
+SECRET_SCAN_EXTENSIONS = {".js", ".kt", ".xml", ".json", ".gradle", ".properties"}
+
+# Regex for common keys (Google API, AWS, Generic), compiled once at import.
+# The anchor is a literal the match must contain: files without it skip the regex.
+SECRET_PATTERNS = [
+    ("Google API Key", b"AIza", re.compile(rb"AIza[0-9A-Za-z-_]{35}")),
+    ("Generic Token", None, re.compile(rb"(?i)(api_key|access_token|secret_key)\s*[:=]\s*['\"][A-Za-z0-9_\-]{20,}['\"]")),
+]
+
+# Android manifest: exported components and XML comment blocks
+EXPORTED_REGEX = re.compile(rb'android:exported="true"')
+XML_COMMENT_REGEX = re.compile(rb"<!--.*?-->", re.DOTALL)
+
+# Risky configuration literals -> issue, one table per audited target
+MANIFEST_KEYWORDS = {
+    b'android:allowBackup="true"': ("HIGH", "Android Security",
+        "Backup is enabled (android:allowBackup='true'). Vault data could be extracted via ADB."),
+    b'android:debuggable="true"': ("CRITICAL", "Android Security",
+        "App is debuggable. Attackers can hook into the process easily."),
+}
+ELECTRON_KEYWORDS = {
+    b"nodeIntegration: true": ("CRITICAL", "Electron Security",
+        "nodeIntegration is enabled. RCE risk if XSS occurs."),
+    b"contextIsolation: false": ("HIGH", "Electron Security",
+        "contextIsolation is disabled. Preload scripts can be manipulated."),
+    b"enableRemoteModule: true": ("HIGH", "Electron Security",
+        "Remote module enabled. This is deprecated and insecure."),
+}
+
+def keywords_regex(keywords):
+    # Longest-first alternation so one regex pass finds every literal of a table
+    return re.compile(b"|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    ))
+
+MANIFEST_KEYWORDS_REGEX = keywords_regex(MANIFEST_KEYWORDS)
+ELECTRON_KEYWORDS_REGEX = keywords_regex(ELECTRON_KEYWORDS)
+
+# List of known safe exported components (with proper intent filters or permissions)
+SAFE_EXPORTED_COMPONENTS = [
+    b"MainActivity",           # Main launcher activity
+    b"OAuthCallbackActivity",  # OAuth callback with deep link intent filter
+    b"OtpImportActivity",      # OTP import with otpauth:// intent filter
+    b"PasswordWidget",         # Widget with custom permission WIDGET_INTERNAL
+    b"GenPwdAutofillService",  # Autofill service with BIND_AUTOFILL_SERVICE permission
+]
+SAFE_EXPORTED_REGEX = re.compile(b"|".join(map(re.escape, SAFE_EXPORTED_COMPONENTS)))
+
+# Files counted in the "Files Scanned" total
+CODE_EXTENSIONS = {".kt", ".js"}
+# Below this many files, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 256
+
+# Files above this size are generated/minified artefacts, not hand-written source
+MAX_FILE_SIZE = 2 * 1024 * 1024
+# Files at least this large are memory-mapped instead of copied into memory
+MMAP_MIN_SIZE = 256 * 1024
+# Leading bytes inspected for NUL to detect binary content
+BINARY_SNIFF_SIZE = 4096
+
+# Per-file code checks: one regex pass over the whole buffer, dispatched on the group name.
+# Patterns are ASCII, so files are scanned as raw bytes without decoding.
+KOTLIN_CHECKS_REGEX = re.compile(rb"(?P<log>Log\.[dewi]\()|(?P<random>java\.util\.Random)")
+JS_CHECKS_REGEX = re.compile(rb"(?P<eval>eval\()|(?P<random>Math\.random\(\))")
+NEWLINE_REGEX = re.compile(rb"\n")
+# Keywords hinting that a log call leaks credentials; one case-insensitive pass over the
+# line instead of lowercasing it and scanning once per keyword
+SENSITIVE_KEYWORDS_REGEX = re.compile(rb"(?i)password|token|key")
+
+def newline_index(content):
+    # Sorted offsets of every newline, prefixed with -1 so that line 1 starts at offset 0.
+    # Built once per file, it turns each offset -> line lookup into a bisect.
+    newlines = [-1]
+    newlines.extend(m.start() for m in NEWLINE_REGEX.finditer(content))
+    return newlines
+
+def line_of(offset, newlines):
+    return bisect_right(newlines, offset)
+
+def line_at(content, line_num, newlines):
+    end = newlines[line_num] if line_num < len(newlines) else len(content)
+    return content[newlines[line_num - 1] + 1:end]
+
+@contextmanager
+def open_source_file(path):
+    # Yields the raw content, or None for unreadable, oversized or binary files.
+    # Large files are memory-mapped so the regex engine reads them without a copy.
+    try:
+        size = os.stat(path).st_size
+        f = open(path, 'rb') if size <= MAX_FILE_SIZE else None
+    except OSError:
+        f = None
+    if f is None:
+        yield None
+        return
+    with f:
+        head = f.read(BINARY_SNIFF_SIZE)
+        if b'\x00' in head:
+            yield None
+        elif size < MMAP_MIN_SIZE:
+            yield head + f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+def walk_files(root, extensions, excluded=EXCLUDED_DIR_NAMES):
+    # Iterative scandir walk: excluded directories are pruned before we descend into them,
+    # and files are filtered on their dirent name before any stat. The suffix rule is
+    # os.path.splitext, the same one scan_source_file uses to pick checkers (so a
+    # dotfile named ".js" has no extension and is skipped)
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded:
+                            stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in extensions and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+# Per-file checkers. They only depend on (path, content) and return issue tuples
+# (severity, category, file, line, message), so they can run in worker processes.
+def check_kotlin(kt_file, content):
+    issues = []
+    kt_name = os.path.basename(kt_file)
+    seen = set()
+    newlines = None
+    for match in KOTLIN_CHECKS_REGEX.finditer(content):
+        newlines = newlines or newline_index(content)
+        line_num = line_of(match.start(), newlines)
+        if (match.lastgroup, line_num) in seen:
+            continue
+        seen.add((match.lastgroup, line_num))
+
+        # Check: Logging Sensitive Info
+        # Skip SafeLog/SecureLogger calls - they are already protected by BuildConfig.DEBUG
+        if match.lastgroup == "log":
+            line = line_at(content, line_num, newlines)
+            # Exclude SafeLog and SecureLogger which are production-safe wrappers
+            if b"SafeLog." not in line and b"SecureLogger." not in line:
+                if SENSITIVE_KEYWORDS_REGEX.search(line):
+                    issues.append(("MEDIUM", "Data Leakage", kt_name, line_num,
+                                   "Potential logging of sensitive data (password/token)."))
+
+        # Check: Weak Random
+        elif match.lastgroup == "random":
+            issues.append(("LOW", "Cryptography", kt_name, line_num,
+                           "Usage of insecure RNG (java.util.Random). Use SecureRandom instead."))
+    return issues
+
+def check_js(js_file, content):
+    issues = []
+    js_name = os.path.basename(js_file)
+    # Math.random() only matters in generator/vault logic outside crypto helpers (test
+    # files and UI effects are ignored); this depends on the path alone
+    path_str = os.fspath(js_file)
+    weak_random_relevant = "crypto" not in path_str and ("generator" in path_str or "vault" in path_str)
+    seen = set()
+    newlines = None
+    for match in JS_CHECKS_REGEX.finditer(content):
+        newlines = newlines or newline_index(content)
+        line_num = line_of(match.start(), newlines)
+        if (match.lastgroup, line_num) in seen:
+            continue
+        seen.add((match.lastgroup, line_num))
+
+        # Check: Dangerous functions
+        if match.lastgroup == "eval":
+            issues.append(("HIGH", "Code Execution", js_name, line_num,
+                           "Usage of eval() detected. High risk of XSS -> RCE."))
+
+        # Check: Weak Random in JS
+        elif match.lastgroup == "random" and weak_random_relevant:
+            issues.append(("MEDIUM", "Cryptography", js_name, line_num,
+                           "Math.random() used in security context. Use window.crypto.getRandomValues()."))
+    return issues
+
+def check_secrets(file_path, content):
+    issues = []
+    for name, anchor, regex in SECRET_PATTERNS:
+        # find() rather than "in": membership on an mmap compares single bytes
+        if anchor and content.find(anchor) == -1:
+            continue
+        if regex.search(content):
+            issues.append(("HIGH", "Hardcoded Secret", os.path.basename(file_path), 0,
+                           f"Possible {name} found."))
+    return issues
+
+# Extension -> checkers run against the file content
+SOURCE_CHECKERS = {".kt": [check_kotlin], ".js": [check_js]}
+for _ext in SECRET_SCAN_EXTENSIONS:
+    SOURCE_CHECKERS.setdefault(_ext, []).append(check_secrets)
+
+def scan_source_file(file_path):
+    # Returns (counted as scanned code file, issues)
+    suffix = os.path.splitext(file_path)[1]
+    issues = []
+    with open_source_file(file_path) as content:
+        if content is None:
+            return False, []
+        for checker in SOURCE_CHECKERS[suffix]:
+            issues.extend(checker(file_path, content))
+    return suffix in CODE_EXTENSIONS, issues
+
 class BColors:
     HEADER = '\033[95m'
     OKBLUE = '\033[94m'
@@ -58,9 +275,11 @@ class SecurityIssue:
         self.message = message
 
 class GenPwdAuditor:
-    def __init__(self, root_path):
+    def __init__(self, root_path, jobs=None):
         self.root_path = Path(root_path)
+        self.jobs = jobs
         self.issues = []
+        self._sev_counts = Counter()  # severity -> number of issues, kept up to date by add_issue
         self.scanned_files = 0
 
     def log(self, message, color=BColors.OKBLUE):
@@ -68,9 +287,10 @@ class GenPwdAuditor:
 
     def add_issue(self, severity, category, file_path, line_num, message):
         self.issues.append(SecurityIssue(severity, category, file_path, line_num, message))
+        self._sev_counts[severity] += 1
         color = BColors.FAIL if severity == "HIGH" else (BColors.WARNING if severity == "MEDIUM" else BColors.OKCYAN)
-        print(f"  [{color}{severity}{BColors.ENDC}] {category}: {message}")
-        print(f"    -> File: {file_path}:{line_num}")
+        sys.stdout.write(f"  [{color}{severity}{BColors.ENDC}] {category}: {message}\n"
+                         f"    -> File: {file_path}:{line_num}\n")
 
     def run_audit(self):
         self.log(f"\n[*] Starting Security Audit on: {self.root_path.absolute()}")
@@ -78,14 +298,12 @@ class GenPwdAuditor:
 
         # 1. Audit Android Security
         self.audit_android_manifest()
-        self.audit_android_code()
 
         # 2. Audit Electron Security
         self.audit_electron_main()
-        self.audit_js_source()
 
-        # 3. Generic Secrets Scan
-        self.scan_for_secrets()
+        # 3. Kotlin/JS code checks + generic secrets scan (single tree walk)
+        self.audit_source_tree()
 
         self.print_report()
 
@@ -97,77 +315,38 @@ class GenPwdAuditor:
             self.log(f"[!] Manifest not found at {manifest_path}", BColors.WARNING)
             return
 
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
+        # Blank out XML comments (keeping their newlines so line numbers stay accurate);
+        # commented-out attributes are not part of the effective configuration
+        content = XML_COMMENT_REGEX.sub(lambda m: b'\n' * m.group().count(b'\n'), manifest_path.read_bytes())
+        lines = content.split(b'\n')
 
-        # Check: android:allowBackup
-        if 'android:allowBackup="true"' in content:
-            self.add_issue("HIGH", "Android Security", "AndroidManifest.xml", 0, 
-                           "Backup is enabled (android:allowBackup='true'). Vault data could be extracted via ADB.")
-        
-        # Check: android:debuggable
-        if 'android:debuggable="true"' in content:
-            self.add_issue("CRITICAL", "Android Security", "AndroidManifest.xml", 0, 
-                           "App is debuggable. Attackers can hook into the process easily.")
+        # Check: android:allowBackup, android:debuggable
+        self._check_config_keywords(content, "AndroidManifest.xml",
+                                    MANIFEST_KEYWORDS, MANIFEST_KEYWORDS_REGEX)
 
         # Check: Exported Activities without permissions
-        # Simple regex to find exported activities
-        exported_regex = re.compile(r'<activity[^>]*android:exported="true"[^>]*>')
-
-        # List of known safe exported components (with proper intent filters or permissions)
-        safe_exported = [
-            "MainActivity",           # Main launcher activity
-            "OAuthCallbackActivity",  # OAuth callback with deep link intent filter
-            "OtpImportActivity",      # OTP import with otpauth:// intent filter
-            "PasswordWidget",         # Widget with custom permission WIDGET_INTERNAL
-            "GenPwdAutofillService",  # Autofill service with BIND_AUTOFILL_SERVICE permission
-        ]
-
-        # Track if we're inside a comment block
-        in_comment = False
-        for i, line in enumerate(lines):
-            # Track XML comment blocks
-            if '<!--' in line:
-                in_comment = True
-            if '-->' in line:
-                in_comment = False
-                continue  # Skip the closing comment line too
-
-            # Skip lines inside comments
-            if in_comment:
+        newlines = newline_index(content)
+        last_line = 0
+        for match in EXPORTED_REGEX.finditer(content):
+            i = line_of(match.start(), newlines) - 1
+            if i + 1 == last_line:
                 continue
-
-            if 'android:exported="true"' in line:
-                # Check if this is a known safe exported component
-                # Look in current line and previous lines (component name may be on different line)
-                context = line + (lines[i-1] if i > 0 else "") + (lines[i-2] if i > 1 else "")
-                is_safe = any(safe_name in context for safe_name in safe_exported)
-                if not is_safe:
-                    self.add_issue("MEDIUM", "Android Security", "AndroidManifest.xml", i+1,
-                                   "Component is exported. Ensure it is protected by permissions or Intent filters are safe.")
-
-    def audit_android_code(self):
-        self.log("[*] Auditing Android Source Code (Kotlin)...")
-        # Recursive scan for Kotlin files
-        for kt_file in self.root_path.rglob("*.kt"):
-            self.scanned_files += 1
-            with open(kt_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines):
-                    # Check: Logging Sensitive Info
-                    # Skip SafeLog/SecureLogger calls - they are already protected by BuildConfig.DEBUG
-                    if ("Log.d(" in line or "Log.e(" in line or "Log.i(" in line or "Log.w(" in line):
-                        # Exclude SafeLog and SecureLogger which are production-safe wrappers
-                        if "SafeLog." not in line and "SecureLogger." not in line:
-                            if "password" in line.lower() or "token" in line.lower() or "key" in line.lower():
-                                self.add_issue("MEDIUM", "Data Leakage", kt_file.name, i+1,
-                                               "Potential logging of sensitive data (password/token).")
-                    
-                    # Check: Weak Random
-                    if "java.util.Random" in line:
-                        self.add_issue("LOW", "Cryptography", kt_file.name, i+1, 
-                                       "Usage of insecure RNG (java.util.Random). Use SecureRandom instead.")
+            last_line = i + 1
+            line = lines[i]
+            # Check if this is a known safe exported component
+            # Look in current line and previous lines (component name may be on different line)
+            context = line + (lines[i-1] if i > 0 else b"") + (lines[i-2] if i > 1 else b"")
+            if not SAFE_EXPORTED_REGEX.search(context):
+                self.add_issue("MEDIUM", "Android Security", "AndroidManifest.xml", i+1,
+                               "Component is exported. Ensure it is protected by permissions or Intent filters are safe.")
+
+    def _check_config_keywords(self, content, file_name, keywords, regex):
+        # One regex pass for every risky setting of the target's table; each one is
+        # reported once per file
+        found = {match.group() for match in regex.finditer(content)}
+        for keyword, (severity, category, message) in keywords.items():
+            if keyword in found:
+                self.add_issue(severity, category, file_name, 0, message)
 
     def audit_electron_main(self):
         self.log("[*] Auditing Electron Configuration...")
@@ -178,90 +357,56 @@ class GenPwdAuditor:
             path = self.root_path / main_file
             if path.exists():
                 found = True
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Check: Node Integration
-                if "nodeIntegration: true" in content:
-                    self.add_issue("CRITICAL", "Electron Security", main_file, 0, 
-                                   "nodeIntegration is enabled. RCE risk if XSS occurs.")
-                
-                # Check: Context Isolation
-                if "contextIsolation: false" in content:
-                    self.add_issue("HIGH", "Electron Security", main_file, 0, 
-                                   "contextIsolation is disabled. Preload scripts can be manipulated.")
-                
-                # Check: Remote Module
-                if "enableRemoteModule: true" in content:
-                    self.add_issue("HIGH", "Electron Security", main_file, 0, 
-                                   "Remote module enabled. This is deprecated and insecure.")
+                # Check: Node Integration, Context Isolation, Remote Module
+                self._check_config_keywords(path.read_bytes(), main_file,
+                                            ELECTRON_KEYWORDS, ELECTRON_KEYWORDS_REGEX)
         
         if not found:
             self.log("[!] Electron main entry point not found.", BColors.WARNING)
 
-    def audit_js_source(self):
-        self.log("[*] Auditing JavaScript Sources...")
-        for js_file in self.root_path.rglob("*.js"):
-            if "node_modules" in str(js_file): continue
-            self.scanned_files += 1
-            
-            with open(js_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines):
-                    # Check: Dangerous functions
-                    if "eval(" in line:
-                        self.add_issue("HIGH", "Code Execution", js_file.name, i+1, 
-                                       "Usage of eval() detected. High risk of XSS -> RCE.")
-                    
-                    # Check: Weak Random in JS
-                    if "Math.random()" in line and "crypto" not in str(js_file):
-                        # Filter out test files or UI effects, focus on logic
-                        if "generator" in str(js_file) or "vault" in str(js_file):
-                            self.add_issue("MEDIUM", "Cryptography", js_file.name, i+1, 
-                                           "Math.random() used in security context. Use window.crypto.getRandomValues().")
-
-    def scan_for_secrets(self):
-        self.log("[*] Scanning for Hardcoded Secrets...")
-        # Regex for common keys (Google API, AWS, Generic)
-        secret_patterns = {
-            "Google API Key": r"AIza[0-9A-Za-z-_]{35}",
-            "Generic Token": r"(?i)(api_key|access_token|secret_key)\s*[:=]\s*['\"][A-Za-z0-9_\-]{20,}['\"]"
-        }
-
-        extensions = {".js", ".kt", ".xml", ".json", ".gradle", ".properties"}
-        
-        for file_path in self.root_path.rglob("*"):
-            if file_path.is_file() and file_path.suffix in extensions:
-                if "node_modules" in str(file_path) or ".git" in str(file_path): continue
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        for name, pattern in secret_patterns.items():
-                            if re.search(pattern, content):
-                                self.add_issue("HIGH", "Hardcoded Secret", file_path.name, 0, 
-                                               f"Possible {name} found.")
-                except Exception:
-                    pass
+    def audit_source_tree(self):
+        self.log("[*] Auditing Source Tree (Kotlin, JavaScript, Hardcoded Secrets)...")
+        # Single walk over the tree; each file is read once and handed to every checker
+        # registered for its extension
+        paths = list(self._walk_once())
+        for counted, issues in self._scan_all(paths):
+            if counted:
+                self.scanned_files += 1
+            for issue in issues:
+                self.add_issue(*issue)
+
+    def _walk_once(self):
+        return walk_files(self.root_path, SOURCE_CHECKERS)
+
+    def _scan_all(self, paths):
+        jobs = self.jobs or os.cpu_count() or 1
+        if jobs <= 1 or len(paths) < PARALLEL_MIN_FILES:
+            return map(scan_source_file, paths)
+        # Files are independent: fan out to worker processes, results come back in order
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(scan_source_file, paths, chunksize=64))
 
     def print_report(self):
-        print(f"\n{BColors.HEADER}=================================================={BColors.ENDC}")
-        print(f"{BColors.HEADER}   GENPWD PRO - SECURITY AUDIT REPORT   {BColors.ENDC}")
-        print(f"{BColors.HEADER}=================================================={BColors.ENDC}")
+        # Build the whole report, then emit it with a single write
+        buf = io.StringIO()
+        buf.write(f"\n{BColors.HEADER}=================================================={BColors.ENDC}\n")
+        buf.write(f"{BColors.HEADER}   GENPWD PRO - SECURITY AUDIT REPORT   {BColors.ENDC}\n")
+        buf.write(f"{BColors.HEADER}=================================================={BColors.ENDC}\n")
         
-        high_sev = len([x for x in self.issues if x.severity in ["HIGH", "CRITICAL"]])
-        med_sev = len([x for x in self.issues if x.severity == "MEDIUM"])
+        high_sev = self._sev_counts["HIGH"] + self._sev_counts["CRITICAL"]
+        med_sev = self._sev_counts["MEDIUM"]
         
-        print(f"Files Scanned: {self.scanned_files}")
-        print(f"Total Issues : {len(self.issues)}")
-        print(f"Critical/High: {high_sev}")
-        print(f"Medium       : {med_sev}")
+        buf.write(f"Files Scanned: {self.scanned_files}\n")
+        buf.write(f"Total Issues : {len(self.issues)}\n")
+        buf.write(f"Critical/High: {high_sev}\n")
+        buf.write(f"Medium       : {med_sev}\n")
         
         if high_sev == 0 and med_sev == 0:
-            print(f"\n{BColors.OKGREEN}[+] No obvious vulnerabilities found. Good job!{BColors.ENDC}")
-            print(f"{BColors.OKBLUE}[*] Remember: This tool only checks for static patterns.{BColors.ENDC}")
+            buf.write(f"\n{BColors.OKGREEN}[+] No obvious vulnerabilities found. Good job!{BColors.ENDC}\n")
+            buf.write(f"{BColors.OKBLUE}[*] Remember: This tool only checks for static patterns.{BColors.ENDC}\n")
         else:
-            print(f"\n{BColors.FAIL}[!] Vulnerabilities detected! Please review the logs above.{BColors.ENDC}")
+            buf.write(f"\n{BColors.FAIL}[!] Vulnerabilities detected! Please review the logs above.{BColors.ENDC}\n")
+        sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     # Assuming script is run from project root
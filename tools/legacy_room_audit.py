@@ -8,20 +8,36 @@ can prioritize follow-up work.
 from __future__ import annotations
 
 import argparse
+import bisect
+import contextlib
 import datetime as _dt
+import functools
 import json
+import mmap
+import os
 import re
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
+
+try:  # Optional: much faster than the stdlib encoder's indent/ensure_ascii=False path
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 # --- Configuration -------------------------------------------------------------------------
 
 DEFAULT_ROOT = Path(__file__).resolve().parents[1]
-DEFAULT_EXTENSIONS = {".kt", ".kts", ".java", ".xml"}
-EXCLUDED_DIR_NAMES = {".git", "build", "node_modules", ".gradle", "audit_results"}
+DEFAULT_EXTENSIONS = frozenset({".kt", ".kts", ".java", ".xml"})
+EXCLUDED_DIR_NAMES = frozenset({".git", "build", "node_modules", ".gradle", "audit_results"})
 AUDIT_RESULTS_DIRNAME = Path("docs") / "audit_results"
+MAX_FILE_SIZE = 2 * 1024 * 1024  # larger files are generated artefacts, not source
+BINARY_SNIFF_SIZE = 4096  # leading bytes checked for NUL to skip binary files
+MMAP_MIN_SIZE = 256 * 1024  # files at least this large are memory-mapped, not copied
+PARALLEL_MIN_FILES = 256  # below this, process start-up costs more than it saves
 
 
 @dataclass(frozen=True)
@@ -30,12 +46,18 @@ class PatternSpec:
 
     name: str
     description: str
-    regex: re.Pattern[str]
+    regex: re.Pattern[bytes]
     excludes: List[Path] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
+    # Literals of which at least one must appear in a line for the regex to match.
+    # Cheap substring checks let most lines skip the regex engine entirely.
+    needles: Tuple[bytes, ...] = ()
+
+    def excludes_path(self, path: Path) -> bool:
+        return any(path == exclude or exclude in path.parents for exclude in self.excludes)
 
-    def matches(self, path: Path, line: str) -> bool:
-        if any(path == exclude or exclude in path.parents for exclude in self.excludes):
+    def matches_line(self, line: bytes) -> bool:
+        if self.needles and not any(needle in line for needle in self.needles):
             return False
         return bool(self.regex.search(line))
 
@@ -44,81 +66,196 @@ PATTERNS: List[PatternSpec] = [
     PatternSpec(
         name="legacy_vault_repository",
         description="References to the Room-backed VaultRepository",
-        regex=re.compile(r"\bVaultRepository\b"),
+        regex=re.compile(rb"\bVaultRepository\b"),
         excludes=[
             Path("android/app/src/main/java/com/julien/genpwdpro/data/repository/VaultRepository.kt"),
         ],
         tags=["legacy", "room"],
+        needles=(b"VaultRepository",),
     ),
     PatternSpec(
         name="room_database_builder",
         description="Direct references to androidx.room APIs",
-        regex=re.compile(r"androidx\\.room|Room\\.databaseBuilder"),
+        regex=re.compile(rb"androidx\.room|Room\.databaseBuilder"),
         tags=["room", "database"],
+        needles=(b"androidx.room", b"Room.databaseBuilder"),
     ),
     PatternSpec(
         name="room_imports",
         description="Import statements for Room classes",
-        regex=re.compile(r"import.*androidx\\.room|import.*VaultDao|import.*VaultEntity"),
+        regex=re.compile(rb"import.*androidx\.room|import.*VaultDao|import.*VaultEntity"),
         tags=["imports", "room"],
+        needles=(b"import",),
     ),
     PatternSpec(
         name="room_annotations",
         description="Usage of Room annotations (Entity, Dao, Query, Database)",
-        regex=re.compile(r"@Database|@Entity|@Dao|@Query"),
+        regex=re.compile(rb"@Database|@Entity|@Dao|@Query"),
         tags=["room", "annotations"],
+        needles=(b"@Database", b"@Entity", b"@Dao", b"@Query"),
     ),
     PatternSpec(
         name="app_database_singletons",
         description="References to AppDatabase (Room concrete DB)",
-        regex=re.compile(r"\bAppDatabase\b"),
+        regex=re.compile(rb"\bAppDatabase\b"),
         tags=["room", "database"],
+        needles=(b"AppDatabase",),
     ),
     PatternSpec(
         name="flow_vault_entities",
         description="Flow emissions of Room entities",
-        regex=re.compile(r"Flow<.*Vault(Entity|Dao).*>"),
+        regex=re.compile(rb"Flow<.*Vault(Entity|Dao).*>"),
         tags=["reactive", "room"],
+        needles=(b"Flow<",),
     ),
     PatternSpec(
         name="coroutine_dao_calls",
         description="Coroutine calls to DAO methods",
-        regex=re.compile(r"suspend\s+fun\s+\w+.*\(.*\).*:\s*(Flow|List)<.*Vault"),
+        regex=re.compile(rb"suspend[ \t]+fun[ \t]+\w+.*\(.*\).*:[ \t]*(Flow|List)<.*Vault"),
         tags=["coroutines", "room"],
+        needles=(b"suspend",),
     ),
 ]
 
+# Union of all patterns, used to locate candidate lines in a single regex pass.
+_COMBINED_REGEX = re.compile(b"|".join(b"(?:" + p.regex.pattern + b")" for p in PATTERNS))
+_NEWLINE_REGEX = re.compile(rb"\n")
+
+# File content as read (small files) or memory-mapped (large files).
+Buffer = Union[bytes, mmap.mmap]
+
+
+class PatternMatches(TypedDict):
+    """Matches of one pattern in one file, stored column-wise as parallel arrays."""
+
+    lines: array[int]
+    contents: List[str]
+
+
+# Per-file matches, keyed by pattern name.
+Findings = Dict[str, PatternMatches]
+
 
 # --- Core logic ----------------------------------------------------------------------------
 
 def iter_source_files(root: Path, *, extensions: Iterable[str]) -> Iterator[Path]:
-    for path in root.rglob("*"):
-        if not path.is_file():
+    """Walk ``root`` with ``os.scandir``, pruning excluded directories before descending.
+
+    Files are filtered on their directory-entry name before ``is_file`` may need a stat,
+    using the ``os.path.splitext`` suffix rule (a dotfile named ``.kt`` has no suffix).
+    """
+    extensions = frozenset(extensions)
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDED_DIR_NAMES:
+                            stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in extensions and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
             continue
-        if path.suffix not in extensions:
-            continue
-        if any(part in EXCLUDED_DIR_NAMES for part in path.parts):
-            continue
-        yield path
 
 
-def scan_file(path: Path, patterns: Iterable[PatternSpec]) -> Dict[str, List[Dict[str, object]]]:
-    findings: Dict[str, List[Dict[str, object]]] = {}
-    try:
-        text = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-
-    for idx, line in enumerate(text.splitlines(), start=1):
-        for pattern in patterns:
-            if pattern.matches(path, line):
-                findings.setdefault(pattern.name, []).append(
-                    {"line": idx, "content": line.strip()}
-                )
+@contextlib.contextmanager
+def _open_source(path: Path) -> Iterator[Optional[Buffer]]:
+    """Yield the raw file content, or ``None`` for oversized or binary files.
+
+    All patterns are ASCII, so matching runs on bytes; only reported lines get decoded.
+    Large files are memory-mapped so the regex engine reads the page cache without a copy.
+    """
+    size = path.stat().st_size
+    if size > MAX_FILE_SIZE:
+        yield None
+        return
+    with path.open("rb") as fh:
+        head = fh.read(BINARY_SNIFF_SIZE)
+        if b"\x00" in head:
+            yield None
+        elif size < MMAP_MIN_SIZE:
+            yield head + fh.read()
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+
+def _newline_index(text: Buffer) -> List[int]:
+    """Offsets of every newline, prefixed with -1 so that line 1 starts at offset 0."""
+    newlines = [-1]
+    newlines.extend(match.start() for match in _NEWLINE_REGEX.finditer(text))
+    return newlines
+
+
+def _line_of(offset: int, newlines: List[int]) -> int:
+    return bisect.bisect_right(newlines, offset)
+
+
+def _line_at(text: Buffer, line_no: int, newlines: List[int]) -> bytes:
+    end = newlines[line_no] if line_no < len(newlines) else len(text)
+    return text[newlines[line_no - 1] + 1 : end]
+
+
+def scan_file(path: Path, patterns: Iterable[PatternSpec]) -> Findings:
+    findings: Findings = {}
+    # Exclusions only depend on the path: resolve them once per file, not once per line.
+    active = [pattern for pattern in patterns if not pattern.excludes_path(path)]
+    if not active:
+        return findings
+
+    with _open_source(path) as text:
+        if text is None:
+            return findings
+
+        # One sweep of the whole buffer with the union of every pattern finds the candidate
+        # lines. Patterns overlap (an import line can hit both room_imports and
+        # room_database_builder), so each candidate line is then checked against every
+        # pattern. Patterns never span a newline, so each match belongs to exactly one line.
+        # The newline index is built lazily: most files have no match at all.
+        newlines: Optional[List[int]] = None
+        last_line = 0
+        for match in _COMBINED_REGEX.finditer(text):
+            newlines = newlines or _newline_index(text)
+            line_no = _line_of(match.start(), newlines)
+            if line_no == last_line:
+                continue
+            last_line = line_no
+            line = _line_at(text, line_no, newlines)
+            for pattern in active:
+                if pattern.matches_line(line):
+                    matches = findings.get(pattern.name)
+                    if matches is None:
+                        matches = findings[pattern.name] = PatternMatches(
+                            lines=array("I"), contents=[]
+                        )
+                    matches["lines"].append(line_no)
+                    matches["contents"].append(line.decode("utf-8", errors="ignore").strip())
     return findings
 
 
-def build_report(root: Path, selected_patterns: Optional[List[str]] = None) -> Dict[str, object]:
+def _scan_path(pattern_names: Tuple[str, ...], path_str: str) -> Findings:
+    """Worker entry point: only names and a path cross the process boundary."""
+    return scan_file(Path(path_str), [p for p in PATTERNS if p.name in pattern_names])
+
+
+def _scan_all(
+    paths: List[Path], patterns: List[PatternSpec], jobs: Optional[int]
+) -> Iterator[Findings]:
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(paths) < PARALLEL_MIN_FILES:
+        for path in paths:
+            yield scan_file(path, patterns)
+        return
+
+    worker = functools.partial(_scan_path, tuple(p.name for p in patterns))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(worker, map(str, paths), chunksize=64)
+
+
+def build_report(
+    root: Path, selected_patterns: Optional[List[str]] = None, *, jobs: Optional[int] = None
+) -> Dict[str, object]:
     patterns = [p for p in PATTERNS if selected_patterns is None or p.name in selected_patterns]
     if not patterns:
         raise SystemExit("No patterns selected for the scan")
@@ -130,13 +267,13 @@ def build_report(root: Path, selected_patterns: Optional[List[str]] = None) -> D
         "totals": {p.name: 0 for p in patterns},
     }
 
-    for file_path in iter_source_files(root, extensions=DEFAULT_EXTENSIONS):
-        file_findings = scan_file(file_path, patterns)
+    paths = list(iter_source_files(root, extensions=DEFAULT_EXTENSIONS))
+    for file_path, file_findings in zip(paths, _scan_all(paths, patterns, jobs)):
         if not file_findings:
             continue
         report["files"][str(file_path.relative_to(root))] = file_findings
         for pattern_name, matches in file_findings.items():
-            report["totals"][pattern_name] += len(matches)
+            report["totals"][pattern_name] += len(matches["lines"])
 
     return report
 
@@ -149,7 +286,7 @@ def _ensure_results_dir(root: Path) -> Path:
 
 def _format_human_report(report: Dict[str, object]) -> str:
     totals: Dict[str, int] = report.get("totals", {})  # type: ignore[assignment]
-    files: Dict[str, Dict[str, List[Dict[str, object]]]] = report.get("files", {})  # type: ignore[assignment]
+    files: Dict[str, Findings] = report.get("files", {})  # type: ignore[assignment]
     patterns_meta: Dict[str, Dict[str, object]] = report.get("patterns", {})  # type: ignore[assignment]
 
     lines: List[str] = []
@@ -170,10 +307,8 @@ def _format_human_report(report: Dict[str, object]) -> str:
     for file_path, findings in sorted(files.items()):
         lines.append(f"- {file_path}")
         for pattern_name, matches in sorted(findings.items()):
-            lines.append(f"  • {pattern_name} ({len(matches)} match(es))")
-            for match in matches:
-                line = match["line"]
-                content = match["content"]
+            lines.append(f"  • {pattern_name} ({len(matches['lines'])} match(es))")
+            for line, content in zip(matches["lines"], matches["contents"]):
                 lines.append(f"    L{line}: {content}")
         lines.append("")
     return "\n".join(lines).rstrip() + "\n"
@@ -187,16 +322,23 @@ def persist_report(report: Dict[str, object], root: Path) -> List[Path]:
     json_path = output_dir / f"{base_name}.json"
 
     text_path.write_text(_format_human_report(report), encoding="utf-8")
-    with json_path.open("w", encoding="utf-8") as fh:
-        json.dump(report, fh, indent=2, ensure_ascii=False)
-        fh.write("\n")
+    if orjson is not None:
+        json_path.write_bytes(
+            orjson.dumps(
+                report, default=list, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+        )
+    else:
+        with json_path.open("w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False, default=list)
+            fh.write("\n")
 
     return [text_path, json_path]
 
 
 def print_report(report: Dict[str, object], *, as_json: bool) -> None:
     if as_json:
-        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False, default=list)
         sys.stdout.write("\n")
         return
 
@@ -218,6 +360,12 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="append",
         help="Name of a pattern to include. Repeat to scan multiple specific patterns.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to the CPU count, 1 disables parallelism).",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -234,16 +382,16 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 2
 
     try:
-        report = build_report(root, selected_patterns=args.pattern)
+        report = build_report(root, selected_patterns=args.pattern, jobs=args.jobs)
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"Failed to build report: {exc}", file=sys.stderr)
         return 1
 
     saved_paths = persist_report(report, root)
     print_report(report, as_json=args.json)
-    print("Report saved to:")
-    for path in saved_paths:
-        print(f"- {path.relative_to(root)}")
+    sys.stdout.write(
+        "Report saved to:\n" + "".join(f"- {path.relative_to(root)}\n" for path in saved_paths)
+    )
     return 0
 
 